@@ -0,0 +1,56 @@
+"""Shared fixtures for the test suite."""
+
+import os
+import re
+import shutil
+import uuid
+from pathlib import Path
+
+import psutil
+import pytest
+
+SHM = Path("/dev/shm")
+SHM_PATTERN = re.compile(r"pytest-(\d+)-[0-9a-f]{32}")
+
+
+def remove_stale_shm_dirs():
+    """Remove /dev/shm directories left behind by test processes that no longer run."""
+    for path in SHM.glob("pytest-*-*"):
+        match = SHM_PATTERN.fullmatch(path.name)
+        if match and path.is_dir() and not psutil.pid_exists(int(match.group(1))):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def checkpoint_base():
+    """Session directory on the in-memory /dev/shm filesystem, or None if unavailable.
+
+    Directories of killed runs are pruned when a later session starts.
+    """
+    if not (SHM.is_dir() and os.access(SHM, os.W_OK)):
+        yield None
+        return
+
+    remove_stale_shm_dirs()
+    root = SHM / f"pytest-{os.getpid()}-{uuid.uuid4().hex}"
+    root.mkdir()
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def checkpoint_root(checkpoint_base, request):
+    """Directory for checkpoints of tests that verify behavior rather than I/O.
+
+    Uses the in-memory /dev/shm filesystem when available to avoid disk writes
+    and falls back to tmp_path elsewhere. Unlike tmp_path, the /dev/shm
+    directory is removed after the test, also when it fails.
+    """
+    if checkpoint_base is None:
+        yield request.getfixturevalue("tmp_path")
+        return
+
+    root = checkpoint_base / uuid.uuid4().hex
+    root.mkdir()
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
@@ -3,27 +3,9 @@
 import torch
 from posthoc_ema import PostHocEMA
 from pathlib import Path
-import shutil
-import pytest
 
 
-@pytest.fixture(autouse=True)
-def cleanup_checkpoints():
-    """Clean up test checkpoints before and after each test."""
-    # Cleanup before test
-    for path in ["./test-checkpoints-diff-sigma"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
-
-    yield
-
-    # Cleanup after test
-    for path in ["./test-checkpoints-diff-sigma"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
-
-
-def test_different_sigma_rels_produce_different_weights():
+def test_different_sigma_rels_produce_different_weights(checkpoint_root: Path):
     """Test that different sigma_rel values produce different weights."""
     # Create a simple model
     model = torch.nn.Sequential(
@@ -47,7 +29,7 @@ def test_different_sigma_rels_produce_different_weights():
     # Create EMA instance
     posthoc_ema = PostHocEMA.from_model(
         model,
-        "test-checkpoints-diff-sigma",  # Changed from "posthoc-ema"
+        checkpoint_root / "test-checkpoints-diff-sigma",
         checkpoint_every=5,
         sigma_rels=(0.05, 0.28),  # Use two different sigma_rels
         update_after_step=0,  # Start immediately to match original behavior
@@ -101,14 +83,8 @@ def test_different_sigma_rels_produce_different_weights():
                         state_dict_1[key], state_dict_2[key], rtol=1e-5, atol=1e-5
                     ), f"Weights for {key} should be different"
 
-    # Clean up
-    if Path("test-checkpoints-diff-sigma").exists():
-        for file in Path("test-checkpoints-diff-sigma").glob("*"):
-            file.unlink()
-        Path("test-checkpoints-diff-sigma").rmdir()
 
-
-def test_different_sigma_rels_produce_different_predictions():
+def test_different_sigma_rels_produce_different_predictions(checkpoint_root: Path):
     """Test that different sigma_rel values produce different predictions."""
     # Create a simple model
     model = torch.nn.Sequential(
@@ -132,7 +108,7 @@ def test_different_sigma_rels_produce_different_predictions():
     # Create EMA instance
     posthoc_ema = PostHocEMA.from_model(
         model,
-        "test-checkpoints-diff-sigma",
+        checkpoint_root / "test-checkpoints-diff-sigma",
         checkpoint_every=5,
         sigma_rels=(0.05, 0.28),
         update_after_step=0,  # Start immediately to match original behavior
@@ -170,14 +146,8 @@ def test_different_sigma_rels_produce_different_predictions():
 
     assert max_diff > 1e-4, "Predictions should be significantly different"
 
-    # Clean up
-    if Path("test-checkpoints-diff-sigma").exists():
-        for file in Path("test-checkpoints-diff-sigma").glob("*"):
-            file.unlink()
-        Path("test-checkpoints-diff-sigma").rmdir()
-
 
-def test_different_sigma_rels_with_only_save_diff():
+def test_different_sigma_rels_with_only_save_diff(checkpoint_root: Path):
     """Test that different sigma_rel values produce different weights with only_save_diff=True."""
     # Create a simple model
     model = torch.nn.Sequential(
@@ -201,7 +171,7 @@ def test_different_sigma_rels_with_only_save_diff():
     # Create EMA instance with only_save_diff=True
     posthoc_ema = PostHocEMA.from_model(
         model,
-        "test-checkpoints-diff-sigma",
+        checkpoint_root / "test-checkpoints-diff-sigma",
         checkpoint_every=5,
         sigma_rels=(0.05, 0.28),
         only_save_diff=True,  # Only save parameters that require gradients
@@ -295,14 +265,8 @@ def test_different_sigma_rels_with_only_save_diff():
 
             assert max_pred_diff > 1e-4, "Predictions should be significantly different"
 
-    # Clean up
-    if Path("test-checkpoints-diff-sigma").exists():
-        for file in Path("test-checkpoints-diff-sigma").glob("*"):
-            file.unlink()
-        Path("test-checkpoints-diff-sigma").rmdir()
 
-
-def test_only_save_diff_doesnt_affect_grad_params():
+def test_only_save_diff_doesnt_affect_grad_params(checkpoint_root: Path):
     """Test that only_save_diff=True doesn't affect parameters that require gradients."""
     # Create a simple model
     model = torch.nn.Sequential(
@@ -326,7 +290,7 @@ def test_only_save_diff_doesnt_affect_grad_params():
     # Create two EMA instances, one with only_save_diff=True and one with False
     posthoc_ema_with_diff = PostHocEMA.from_model(
         model,
-        "test-checkpoints-diff-sigma",
+        checkpoint_root / "test-checkpoints-diff-sigma",
         checkpoint_every=1,  # Checkpoint every update for debugging
         sigma_rels=(0.05, 0.4),
         only_save_diff=True,
@@ -335,7 +299,7 @@ def test_only_save_diff_doesnt_affect_grad_params():
 
     posthoc_ema_without_diff = PostHocEMA.from_model(
         model,
-        "test-checkpoints-diff-sigma",
+        checkpoint_root / "test-checkpoints-diff-sigma",
         checkpoint_every=1,  # Checkpoint every update for debugging
         sigma_rels=(0.05, 0.4),
         only_save_diff=False,
@@ -360,7 +324,7 @@ def test_only_save_diff_doesnt_affect_grad_params():
     # Print checkpoint files
     print("\nCheckpoint files:")
     print("With diff:")
-    for f in sorted(Path("test-checkpoints-diff-sigma").glob("*.pt")):
+    for f in sorted((checkpoint_root / "test-checkpoints-diff-sigma").glob("*.pt")):
         print(f"  {f.name}")
         # Load checkpoint and print its keys
         checkpoint = torch.load(str(f))
@@ -368,7 +332,7 @@ def test_only_save_diff_doesnt_affect_grad_params():
             f"  Keys in checkpoint: {sorted(k for k in checkpoint.keys() if k not in ['initted', 'step'])}"
         )
     print("Without diff:")
-    for f in sorted(Path("test-checkpoints-diff-sigma").glob("*.pt")):
+    for f in sorted((checkpoint_root / "test-checkpoints-diff-sigma").glob("*.pt")):
         print(f"  {f.name}")
         # Load checkpoint and print its keys
         checkpoint = torch.load(str(f))
@@ -420,10 +384,3 @@ def test_only_save_diff_doesnt_affect_grad_params():
                     assert torch.allclose(
                         param_with_diff, param_without_diff, rtol=1e-5, atol=1e-5
                     ), f"Parameter {key} differs between only_save_diff=True and False"
-
-    # Clean up
-    for path in ["test-checkpoints-diff-sigma"]:
-        if Path(path).exists():
-            for file in Path(path).glob("*"):
-                file.unlink()
-            Path(path).rmdir()
@@ -3,28 +3,10 @@
 import torch
 from torch import nn
 from pathlib import Path
-import pytest
-import shutil
 from posthoc_ema import PostHocEMA
 
 
-@pytest.fixture(autouse=True)
-def cleanup_checkpoints():
-    """Clean up test checkpoints before and after each test."""
-    # Cleanup before test
-    for path in ["./test-checkpoints-large-sigma"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
-
-    yield
-
-    # Cleanup after test
-    for path in ["./test-checkpoints-large-sigma"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
-
-
-def test_sigma_rel_range_behavior():
+def test_sigma_rel_range_behavior(checkpoint_root: Path):
     """Test behavior across a range of sigma_rel values."""
     # Create a simple model
     model = nn.Sequential(
@@ -38,7 +20,7 @@ def test_sigma_rel_range_behavior():
     # Create EMA instance with multiple sigma_rels
     posthoc_ema = PostHocEMA.from_model(
         model,
-        "test-checkpoints-large-sigma",
+        checkpoint_root / "test-checkpoints-large-sigma",
         checkpoint_every=5,
         sigma_rels=(0.05, 0.28, 0.8),  # Test up to 0.8 as larger values can be unstable
         update_every=1,
@@ -134,12 +116,6 @@ def test_sigma_rel_range_behavior():
             f"max_diff={max_pred_diff}"
         )
 
-    # Clean up
-    if Path("test-checkpoints-large-sigma").exists():
-        for file in Path("test-checkpoints-large-sigma").glob("*"):
-            file.unlink()
-        Path("test-checkpoints-large-sigma").rmdir()
-
 
 def test_solve_weights_numerical_stability():
     """Test numerical stability of solve_weights with different sigma_rel combinations."""
@@ -1,9 +1,7 @@
 """Tests to verify our implementation matches the reference implementation."""
 
-import shutil
 from pathlib import Path
 
-import pytest
 import torch
 from torch import nn
 
@@ -62,22 +60,6 @@ def print_state_comparison(step: int, ref_model: nn.Module, our_model: nn.Module
                 )
 
 
-@pytest.fixture(autouse=True)
-def cleanup_checkpoints():
-    """Clean up test checkpoints before and after each test."""
-    # Cleanup before test
-    for path in ["./test-checkpoints-ref", "./test-checkpoints-our"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
-
-    yield
-
-    # Cleanup after test
-    for path in ["./test-checkpoints-ref", "./test-checkpoints-our"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
-
-
 def test_p_dot_p_matches_reference():
     """Test that our p_dot_p implementation matches the reference."""
     test_cases = [
@@ -195,7 +177,7 @@ def test_gamma_conversion_matches_reference():
         assert abs(our_gamma - ref_gamma) < 1e-6
 
 
-def test_same_output_as_reference():
+def test_same_output_as_reference(checkpoint_root: Path):
     """Test that our implementation produces identical outputs to the reference."""
     # Create a simple model
     net = nn.Linear(512, 512)
@@ -216,13 +198,13 @@ def test_same_output_as_reference():
         sigma_rels=sigma_rels,
         update_every=update_every,
         checkpoint_every_num_steps=checkpoint_every,
-        checkpoint_folder="./test-checkpoints-ref",
+        checkpoint_folder=checkpoint_root / "test-checkpoints-ref",
         checkpoint_dtype=torch.float32,
     )
 
     our_emas = OurPostHocEMA.from_model(
         model=net,
-        checkpoint_dir="./test-checkpoints-our",
+        checkpoint_dir=checkpoint_root / "test-checkpoints-our",
         update_every=update_every,
         checkpoint_every=checkpoint_every,
         sigma_rels=sigma_rels,
@@ -253,13 +235,13 @@ def test_same_output_as_reference():
     print(f"\nSynthesizing with target_sigma = {target_sigma}")
 
     # Get reference checkpoints and weights
-    ref_checkpoints = sorted(Path("./test-checkpoints-ref").glob("*.pt"))
+    ref_checkpoints = sorted((checkpoint_root / "test-checkpoints-ref").glob("*.pt"))
     print("\nReference checkpoints:")
     for cp in ref_checkpoints:
         print(f"  {cp.name}")
 
     # Get our checkpoints and weights
-    our_checkpoints = sorted(Path("./test-checkpoints-our").glob("*.pt"))
+    our_checkpoints = sorted((checkpoint_root / "test-checkpoints-our").glob("*.pt"))
     print("\nOur checkpoints:")
     for cp in our_checkpoints:
         print(f"  {cp.name}")
@@ -283,7 +265,7 @@ def test_same_output_as_reference():
         ), "Output from our implementation doesn't match reference"
 
     our_emas_from_disk = OurPostHocEMA.from_path(
-        checkpoint_dir="./test-checkpoints-our",
+        checkpoint_dir=checkpoint_root / "test-checkpoints-our",
         model=net,
         sigma_rels=sigma_rels,  # Use same sigma_rels as original
         update_every=update_every,  # Use same update_every as original
@@ -308,7 +290,7 @@ def test_same_output_as_reference():
         ), "Output from loaded implementation doesn't match reference"
 
 
-def test_update_after_step():
+def test_update_after_step(checkpoint_root: Path):
     """Test that EMA updates only start after update_after_step steps."""
     # Create a simple model
     net = nn.Linear(512, 512)
@@ -321,7 +303,7 @@ def test_update_after_step():
 
     our_emas = OurPostHocEMA.from_model(
         model=net,
-        checkpoint_dir="./test-checkpoints-our",
+        checkpoint_dir=checkpoint_root / "test-checkpoints-our",
         update_every=update_every,
         checkpoint_every=checkpoint_every,
         sigma_rels=sigma_rels,
@@ -384,7 +366,7 @@ def test_update_after_step():
         assert weights_changed, "EMA weights did not change after update_after_step"
 
 
-def test_same_output_as_reference_different_step():
+def test_same_output_as_reference_different_step(checkpoint_root: Path):
     """Test that our implementation produces identical outputs to the reference when synthesizing at a different step."""
     # Create a simple model
     net = nn.Linear(512, 512)
@@ -405,13 +387,13 @@ def test_same_output_as_reference_different_step():
         sigma_rels=sigma_rels,
         update_every=update_every,
         checkpoint_every_num_steps=checkpoint_every,
-        checkpoint_folder="./test-checkpoints-ref",
+        checkpoint_folder=checkpoint_root / "test-checkpoints-ref",
         checkpoint_dtype=torch.float32,
     )
 
     our_emas = OurPostHocEMA.from_model(
         model=net,
-        checkpoint_dir="./test-checkpoints-our",
+        checkpoint_dir=checkpoint_root / "test-checkpoints-our",
         update_every=update_every,
         checkpoint_every=checkpoint_every,
         sigma_rels=sigma_rels,
@@ -443,13 +425,13 @@ def test_same_output_as_reference_different_step():
     print(f"\nSynthesizing with target_sigma = {target_sigma} at step {target_step}")
 
     # Get reference checkpoints and weights
-    ref_checkpoints = sorted(Path("./test-checkpoints-ref").glob("*.pt"))
+    ref_checkpoints = sorted((checkpoint_root / "test-checkpoints-ref").glob("*.pt"))
     print("\nReference checkpoints:")
     for cp in ref_checkpoints:
         print(f"  {cp.name}")
 
     # Get our checkpoints and weights
-    our_checkpoints = sorted(Path("./test-checkpoints-our").glob("*.pt"))
+    our_checkpoints = sorted((checkpoint_root / "test-checkpoints-our").glob("*.pt"))
     print("\nOur checkpoints:")
     for cp in our_checkpoints:
         print(f"  {cp.name}")
@@ -471,8 +453,3 @@ def test_same_output_as_reference_different_step():
         assert torch.allclose(
             ref_output, our_output, rtol=1e-4, atol=1e-4
         ), "Output from our implementation doesn't match reference"
-
-    # Clean up
-    for path in ["./test-checkpoints-ref", "./test-checkpoints-our"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
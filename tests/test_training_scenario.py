@@ -7,7 +7,7 @@ from posthoc_ema import PostHocEMA
 from posthoc_ema.karras_ema import KarrasEMA
 
 
-def test_training_scenario(tmp_path: Path):
+def test_training_scenario(checkpoint_root: Path):
     """Test PostHocEMA in a simulated training scenario.
 
     This test simulates:
@@ -28,7 +28,7 @@ def test_training_scenario(tmp_path: Path):
     # Initialize PostHocEMA
     posthoc_ema = PostHocEMA.from_model(
         model=model,
-        checkpoint_dir=tmp_path,
+        checkpoint_dir=checkpoint_root,
         max_checkpoints=100,
         sigma_rels=(0.15,),  # Match Karras EMA
         update_every=1,
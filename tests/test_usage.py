@@ -10,28 +10,42 @@ import shutil
 from posthoc_ema import PostHocEMA
 
 
-@pytest.fixture(autouse=True)
-def cleanup_checkpoints():
-    """Clean up test checkpoints before and after each test."""
-    # Cleanup before test
-    for path in ["posthoc-ema", "posthoc-ema-diff", "posthoc-ema-all"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
+@pytest.fixture(scope="module")
+def prebuilt_ema(checkpoint_base, tmp_path_factory):
+    """Train a model with EMA once and share its checkpoints across tests.
 
-    yield
+    Returns the final model state dict and the source checkpoint directory.
+    Tests should copy the directory into their own checkpoint_root before use.
+    """
+    model = torch.nn.Linear(512, 512)
+    if checkpoint_base is None:
+        root = tmp_path_factory.mktemp("prebuilt")
+    else:
+        root = checkpoint_base / "prebuilt"
+    checkpoint_dir = root / "posthoc-ema"
+    posthoc_ema = PostHocEMA.from_model(
+        model,
+        checkpoint_dir,
+        checkpoint_every=5,  # More frequent checkpoints for testing
+        sigma_rels=(0.05, 0.28),  # Explicitly set sigma_rels
+        update_after_step=0,  # Start immediately to match original behavior
+    )
 
-    # Cleanup after test
-    for path in ["posthoc-ema", "posthoc-ema-diff", "posthoc-ema-all"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
+    for _ in range(10):  # Reduced from 1000 for test speed
+        with torch.no_grad():
+            model.weight.normal_()
+            model.bias.normal_()
+        posthoc_ema.update_(model)
+
+    return deepcopy(model.state_dict()), checkpoint_dir
 
 
-def test_basic_usage_with_updates(tmp_path: Path):
+def test_basic_usage_with_updates(checkpoint_root: Path):
     """Test the basic usage pattern with model updates."""
     model = torch.nn.Linear(512, 512)
     posthoc_ema = PostHocEMA.from_model(
         model,
-        tmp_path / "basic-usage",
+        checkpoint_root / "basic-usage",
         checkpoint_every=5,  # More frequent checkpoints for testing
         sigma_rels=(0.05, 0.28),  # Explicitly set sigma_rels
         update_after_step=0,  # Start immediately to match original behavior
@@ -41,8 +55,8 @@ def test_basic_usage_with_updates(tmp_path: Path):
     for _ in range(10):  # Reduced from 1000 for test speed
         # mutate your network, normally with an optimizer
         with torch.no_grad():
-            model.weight.copy_(torch.randn_like(model.weight))
-            model.bias.copy_(torch.randn_like(model.bias))
+            model.weight.normal_()
+            model.bias.normal_()
         posthoc_ema.update_(model)
 
     # Verify we can get predictions
@@ -51,23 +65,15 @@ def test_basic_usage_with_updates(tmp_path: Path):
     assert predictions.shape == (1, 512)
 
 
-def test_context_manager_helper(tmp_path: Path):
+def test_context_manager_helper(prebuilt_ema, checkpoint_root: Path):
     """Test using the context manager helper for EMA model."""
+    model_state_dict, src_checkpoint_dir = prebuilt_ema
     model = torch.nn.Linear(512, 512)
-    posthoc_ema = PostHocEMA.from_model(
-        model,
-        tmp_path / "context-manager",
-        checkpoint_every=5,  # More frequent checkpoints for testing
-        sigma_rels=(0.05, 0.28),  # Explicitly set sigma_rels
-        update_after_step=0,  # Start immediately to match original behavior
-    )
+    model.load_state_dict(model_state_dict)
 
-    # Update enough times to create checkpoints
-    for _ in range(10):  # Reduced from 1000 for test speed
-        with torch.no_grad():
-            model.weight.copy_(torch.randn_like(model.weight))
-            model.bias.copy_(torch.randn_like(model.bias))
-        posthoc_ema.update_(model)
+    checkpoint_dir = checkpoint_root / "context-manager"
+    shutil.copytree(src_checkpoint_dir, checkpoint_dir)
+    posthoc_ema = PostHocEMA.from_path(checkpoint_dir, model, sigma_rels=(0.05, 0.28))
 
     data = torch.randn(1, 512)
     predictions = model(data)
@@ -78,23 +84,15 @@ def test_context_manager_helper(tmp_path: Path):
         assert ema_predictions.shape == predictions.shape
 
 
-def test_manual_cpu_usage(tmp_path: Path):
+def test_manual_cpu_usage(prebuilt_ema, checkpoint_root: Path):
     """Test manual CPU usage without the context manager."""
+    model_state_dict, src_checkpoint_dir = prebuilt_ema
     model = torch.nn.Linear(512, 512)
-    posthoc_ema = PostHocEMA.from_model(
-        model,
-        tmp_path / "manual-cpu",
-        checkpoint_every=5,  # More frequent checkpoints for testing
-        sigma_rels=(0.05, 0.28),  # Explicitly set sigma_rels
-        update_after_step=0,  # Start immediately to match original behavior
-    )
+    model.load_state_dict(model_state_dict)
 
-    # Update enough times to create checkpoints
-    for _ in range(10):  # Reduced from 1000 for test speed
-        with torch.no_grad():
-            model.weight.copy_(torch.randn_like(model.weight))
-            model.bias.copy_(torch.randn_like(model.bias))
-        posthoc_ema.update_(model)
+    checkpoint_dir = checkpoint_root / "manual-cpu"
+    shutil.copytree(src_checkpoint_dir, checkpoint_dir)
+    posthoc_ema = PostHocEMA.from_path(checkpoint_dir, model, sigma_rels=(0.05, 0.28))
 
     data = torch.randn(1, 512)
 
@@ -108,24 +106,15 @@ def test_manual_cpu_usage(tmp_path: Path):
         del ema_model
 
 
-def test_synthesize_after_training(tmp_path: Path):
+def test_synthesize_after_training(prebuilt_ema, checkpoint_root: Path):
     """Test synthesizing EMA after training."""
+    model_state_dict, src_checkpoint_dir = prebuilt_ema
     model = torch.nn.Linear(512, 512)
-    checkpoint_dir = tmp_path / "synthesize-after"
+    model.load_state_dict(model_state_dict)
 
-    # First create some checkpoints
-    posthoc_ema = PostHocEMA.from_model(
-        model,
-        checkpoint_dir,
-        checkpoint_every=5,  # More frequent checkpoints for testing
-        sigma_rels=(0.05, 0.28),  # Explicitly set sigma_rels
-        update_after_step=0,  # Start immediately to match original behavior
-    )
-    for _ in range(10):  # Reduced from 1000 for test speed
-        with torch.no_grad():
-            model.weight.copy_(torch.randn_like(model.weight))
-            model.bias.copy_(torch.randn_like(model.bias))
-        posthoc_ema.update_(model)
+    # Checkpoints were created by the prebuilt training run
+    checkpoint_dir = checkpoint_root / "synthesize-after"
+    shutil.copytree(src_checkpoint_dir, checkpoint_dir)
 
     data = torch.randn(1, 512)
 
@@ -136,24 +125,13 @@ def test_synthesize_after_training(tmp_path: Path):
         assert ema_predictions.shape == (1, 512)
 
 
-def test_synthesize_without_model(tmp_path: Path):
+def test_synthesize_without_model(prebuilt_ema, checkpoint_root: Path):
     """Test synthesizing EMA without model."""
-    model = torch.nn.Linear(512, 512)
-    checkpoint_dir = tmp_path / "synthesize-without"
+    _, src_checkpoint_dir = prebuilt_ema
 
-    # First create some checkpoints
-    posthoc_ema = PostHocEMA.from_model(
-        model,
-        checkpoint_dir,
-        checkpoint_every=5,  # More frequent checkpoints for testing
-        sigma_rels=(0.05, 0.28),  # Explicitly set sigma_rels
-        update_after_step=0,  # Start immediately to match original behavior
-    )
-    for _ in range(10):  # Reduced from 1000 for test speed
-        with torch.no_grad():
-            model.weight.copy_(torch.randn_like(model.weight))
-            model.bias.copy_(torch.randn_like(model.bias))
-        posthoc_ema.update_(model)
+    # Checkpoints were created by the prebuilt training run
+    checkpoint_dir = checkpoint_root / "synthesize-without"
+    shutil.copytree(src_checkpoint_dir, checkpoint_dir)
 
     # Or without model
     posthoc_ema = PostHocEMA.from_path(checkpoint_dir)
@@ -162,25 +140,15 @@ def test_synthesize_without_model(tmp_path: Path):
         assert len(state_dict) > 0
 
 
-def test_set_parameters_during_training(tmp_path: Path):
+def test_set_parameters_during_training(prebuilt_ema, checkpoint_root: Path):
     """Test setting parameters to EMA state during training."""
+    model_state_dict, src_checkpoint_dir = prebuilt_ema
     model = torch.nn.Linear(512, 512)
-    checkpoint_dir = tmp_path / "set-params"
-
-    posthoc_ema = PostHocEMA.from_model(
-        model,
-        checkpoint_dir,
-        checkpoint_every=5,  # More frequent checkpoints for testing
-        sigma_rels=(0.05, 0.28),  # Explicitly set sigma_rels
-        update_after_step=0,  # Start immediately to match original behavior
-    )
+    model.load_state_dict(model_state_dict)
 
-    # Update enough times to create checkpoints
-    for _ in range(10):  # Reduced from 1000 for test speed
-        with torch.no_grad():
-            model.weight.copy_(torch.randn_like(model.weight))
-            model.bias.copy_(torch.randn_like(model.bias))
-        posthoc_ema.update_(model)
+    checkpoint_dir = checkpoint_root / "set-params"
+    shutil.copytree(src_checkpoint_dir, checkpoint_dir)
+    posthoc_ema = PostHocEMA.from_path(checkpoint_dir, model, sigma_rels=(0.05, 0.28))
 
     # Save original state
     original_state = deepcopy(model.state_dict())
@@ -194,7 +162,7 @@ def test_set_parameters_during_training(tmp_path: Path):
         )
 
 
-def test_only_requires_grad_parameters(tmp_path: Path):
+def test_only_requires_grad_parameters(checkpoint_root: Path):
     """Test that only parameters with requires_grad=True are included in state dict when only_save_diff=True."""
     # Create a model with some parameters that don't require gradients
     model = torch.nn.Sequential(
@@ -211,7 +179,7 @@ def test_only_requires_grad_parameters(tmp_path: Path):
     # Test with only_save_diff=True
     posthoc_ema_diff = PostHocEMA.from_model(
         model,
-        tmp_path / "only-grad-diff",
+        checkpoint_root / "only-grad-diff",
         checkpoint_every=5,
         sigma_rels=(0.05, 0.28),
         only_save_diff=True,
@@ -221,7 +189,7 @@ def test_only_requires_grad_parameters(tmp_path: Path):
     # Test with default (only_save_diff=False)
     posthoc_ema_all = PostHocEMA.from_model(
         model,
-        tmp_path / "only-grad-all",
+        checkpoint_root / "only-grad-all",
         checkpoint_every=5,
         sigma_rels=(0.05, 0.28),
         update_after_step=0,  # Start immediately to match original behavior
@@ -232,7 +200,7 @@ def test_only_requires_grad_parameters(tmp_path: Path):
         with torch.no_grad():
             for param in model.parameters():
                 if param.requires_grad:
-                    param.copy_(torch.randn_like(param))
+                    param.normal_()
         posthoc_ema_diff.update_(model)
         posthoc_ema_all.update_(model)
 
@@ -266,15 +234,9 @@ def test_only_requires_grad_parameters(tmp_path: Path):
         assert "1.running_mean" in state_dict
         assert "1.running_var" in state_dict
 
-    # Clean up
-    for path in ["posthoc-ema-diff", "posthoc-ema-all"]:
-        if Path(path).exists():
-            for file in Path(path).glob("*"):
-                file.unlink()
-            Path(path).rmdir()
-
 
-def test_checkpoint_size_with_requires_grad():
+@pytest.mark.slow
+def test_checkpoint_size_with_requires_grad(tmp_path: Path):
     """Test that checkpoint files are smaller when fewer parameters require gradients."""
     # Create two identical models with larger layers
     model_all_grad = torch.nn.Sequential(
@@ -305,7 +267,7 @@ def test_checkpoint_size_with_requires_grad():
     # Create EMA instances with same settings
     posthoc_ema_all = PostHocEMA.from_model(
         model_all_grad,
-        "posthoc-ema-all",
+        tmp_path / "posthoc-ema-all",
         checkpoint_every=5,
         sigma_rels=(0.05,),  # Single sigma_rel for simpler comparison
         update_after_step=0,  # Start immediately to match original behavior
@@ -313,7 +275,7 @@ def test_checkpoint_size_with_requires_grad():
 
     posthoc_ema_some = PostHocEMA.from_model(
         model_some_grad,
-        "posthoc-ema-some",
+        tmp_path / "posthoc-ema-some",
         checkpoint_every=5,
         sigma_rels=(0.05,),  # Single sigma_rel for simpler comparison
         only_save_diff=True,  # Only save parameters with requires_grad=True
@@ -330,16 +292,15 @@ def test_checkpoint_size_with_requires_grad():
                 if (
                     param_some.requires_grad
                 ):  # Only update parameters that require gradients
-                    rand_values = torch.randn_like(param_all)
-                    param_all.copy_(rand_values)
-                    param_some.copy_(rand_values)
+                    param_all.normal_()
+                    param_some.copy_(param_all)
 
         posthoc_ema_all.update_(model_all_grad)
         posthoc_ema_some.update_(model_some_grad)
 
     # Get file sizes
-    all_grad_files = sorted(Path("posthoc-ema-all").glob("*.pt"))
-    some_grad_files = sorted(Path("posthoc-ema-some").glob("*.pt"))
+    all_grad_files = sorted((tmp_path / "posthoc-ema-all").glob("*.pt"))
+    some_grad_files = sorted((tmp_path / "posthoc-ema-some").glob("*.pt"))
 
     # Compare sizes of corresponding checkpoints
     for all_file, some_file in zip(all_grad_files, some_grad_files):
@@ -352,15 +313,9 @@ def test_checkpoint_size_with_requires_grad():
             f"All grad size: {all_size}, Some grad size: {some_size}"
         )
 
-    # Clean up
-    for path in ["posthoc-ema-all", "posthoc-ema-some"]:
-        if Path(path).exists():
-            for file in Path(path).glob("*"):
-                file.unlink()
-            Path(path).rmdir()
-
 
-def test_ram_usage_with_requires_grad():
+@pytest.mark.slow
+def test_ram_usage_with_requires_grad(tmp_path: Path):
     """Test that RAM usage is lower when fewer parameters require gradients."""
 
     def get_ram_usage():
@@ -402,7 +357,7 @@ def test_ram_usage_with_requires_grad():
     # Create EMA instances with same settings
     posthoc_ema_all = PostHocEMA.from_model(
         model_all_grad,
-        "posthoc-ema-all",
+        tmp_path / "posthoc-ema-all",
         checkpoint_every=5,
         sigma_rels=(0.05,),  # Single sigma_rel for simpler comparison
         update_after_step=0,  # Start immediately to match original behavior
@@ -422,7 +377,7 @@ def test_ram_usage_with_requires_grad():
     # Create second EMA instance
     posthoc_ema_some = PostHocEMA.from_model(
         model_some_grad,
-        "posthoc-ema-some",
+        tmp_path / "posthoc-ema-some",
         checkpoint_every=5,
         sigma_rels=(0.05,),  # Single sigma_rel for simpler comparison
         update_after_step=0,  # Start immediately to match original behavior
@@ -442,15 +397,8 @@ def test_ram_usage_with_requires_grad():
         f"Difference: {ram_diff:.2f}MB"
     )
 
-    # Clean up
-    for path in ["posthoc-ema-all", "posthoc-ema-some"]:
-        if Path(path).exists():
-            for file in Path(path).glob("*"):
-                file.unlink()
-            Path(path).rmdir()
 
-
-def test_save_full_weights():
+def test_save_full_weights(checkpoint_root: Path):
     """Test that all weights are saved when only_save_diff=False, regardless of requires_grad."""
     # Create a model with some parameters that don't require gradients
     model = torch.nn.Sequential(
@@ -472,7 +420,7 @@ def test_save_full_weights():
     # Create EMA instance with only_save_diff=False
     posthoc_ema = PostHocEMA.from_model(
         model,
-        "posthoc-ema",
+        checkpoint_root / "posthoc-ema",
         checkpoint_every=5,
         sigma_rels=(0.05,),
         only_save_diff=False,  # Save all parameters
@@ -485,7 +433,7 @@ def test_save_full_weights():
             # Only update parameters that require gradients
             for param in model.parameters():
                 if param.requires_grad:
-                    param.copy_(torch.randn_like(param))
+                    param.normal_()
         posthoc_ema.update_(model)
 
     # Load the checkpoint and verify all parameters are present with correct values
@@ -513,14 +461,8 @@ def test_save_full_weights():
         assert "1.running_mean" in state_dict
         assert "1.running_var" in state_dict
 
-    # Clean up
-    if Path("posthoc-ema").exists():
-        for file in Path("posthoc-ema").glob("*"):
-            file.unlink()
-        Path("posthoc-ema").rmdir()
-
 
-def test_checkpoint_dtype():
+def test_checkpoint_dtype(checkpoint_root: Path):
     """Test that checkpoint dtype is respected and defaults to original dtype."""
     # Create a model with mixed dtypes
     model = torch.nn.Sequential(
@@ -535,7 +477,7 @@ def test_checkpoint_dtype():
     # Test default behavior (preserve original dtypes)
     posthoc_ema_default = PostHocEMA.from_model(
         model,
-        "posthoc-ema-default",
+        checkpoint_root / "posthoc-ema-default",
         checkpoint_every=5,
         sigma_rels=(0.05,),
         update_after_step=0,  # Start immediately to match original behavior
@@ -544,7 +486,7 @@ def test_checkpoint_dtype():
     # Test with specified dtype (bfloat16)
     posthoc_ema_bfloat16 = PostHocEMA.from_model(
         model,
-        "posthoc-ema-bfloat16",
+        checkpoint_root / "posthoc-ema-bfloat16",
         checkpoint_every=5,
         sigma_rels=(0.05,),
         checkpoint_dtype=torch.bfloat16,
@@ -554,8 +496,8 @@ def test_checkpoint_dtype():
     # Update both models
     for _ in range(10):
         with torch.no_grad():
-            model[0].weight.copy_(torch.randn_like(model[0].weight))
-            model[0].bias.copy_(torch.randn_like(model[0].bias))
+            model[0].weight.normal_()
+            model[0].bias.normal_()
         posthoc_ema_default.update_(model)
         posthoc_ema_bfloat16.update_(model)
 
@@ -580,15 +522,8 @@ def test_checkpoint_dtype():
         assert state_dict["1.running_mean"].dtype == torch.bfloat16
         assert state_dict["1.running_var"].dtype == torch.bfloat16
 
-    # Clean up
-    for path in ["posthoc-ema-default", "posthoc-ema-bfloat16"]:
-        if Path(path).exists():
-            for file in Path(path).glob("*"):
-                file.unlink()
-            Path(path).rmdir()
 
-
-def test_context_manager_with_only_save_diff():
+def test_context_manager_with_only_save_diff(checkpoint_root: Path):
     """Test that context manager works correctly with only_save_diff=True."""
     # Create a model with some parameters that don't require gradients
     model = torch.nn.Sequential(
@@ -605,7 +540,7 @@ def test_context_manager_with_only_save_diff():
     # Create EMA instance with only_save_diff=True
     posthoc_ema = PostHocEMA.from_model(
         model,
-        "posthoc-ema",
+        checkpoint_root / "posthoc-ema",
         checkpoint_every=5,
         sigma_rels=(0.05,),
         only_save_diff=True,  # Only save parameters with requires_grad=True
@@ -618,7 +553,7 @@ def test_context_manager_with_only_save_diff():
             # Only update parameters that require gradients
             for param in model.parameters():
                 if param.requires_grad:
-                    param.copy_(torch.randn_like(param))
+                    param.normal_()
         posthoc_ema.update_(model)
 
     # This should work without errors despite missing parameters in state dict
@@ -627,14 +562,8 @@ def test_context_manager_with_only_save_diff():
         output = ema_model(x)
         assert output.shape == (1, 512)
 
-    # Clean up
-    if Path("posthoc-ema").exists():
-        for file in Path("posthoc-ema").glob("*"):
-            file.unlink()
-        Path("posthoc-ema").rmdir()
-
 
-def test_calculation_dtype():
+def test_calculation_dtype(checkpoint_root: Path):
     """Test that synthesis calculations use specified calculation_dtype."""
     # Create a model with mixed dtypes
     model = torch.nn.Sequential(
@@ -648,7 +577,7 @@ def test_calculation_dtype():
     # Create EMA instance
     posthoc_ema = PostHocEMA.from_model(
         model,
-        "posthoc-ema",
+        checkpoint_root / "posthoc-ema",
         checkpoint_every=5,
         sigma_rels=(0.05,),
         update_after_step=0,  # Start immediately to match original behavior
@@ -657,8 +586,8 @@ def test_calculation_dtype():
     # Update model
     for _ in range(10):
         with torch.no_grad():
-            model[0].weight.copy_(torch.randn_like(model[0].weight))
-            model[0].bias.copy_(torch.randn_like(model[0].bias))
+            model[0].weight.normal_()
+            model[0].bias.normal_()
         posthoc_ema.update_(model)
 
     # Test default behavior (float32 calculations, float16 output)
@@ -683,20 +612,14 @@ def test_calculation_dtype():
         assert state_dict["1.running_mean"].dtype == torch.float16
         assert state_dict["1.running_var"].dtype == torch.float16
 
-    # Clean up
-    if Path("posthoc-ema").exists():
-        for file in Path("posthoc-ema").glob("*"):
-            file.unlink()
-        Path("posthoc-ema").rmdir()
 
-
-def test_from_model_with_existing_checkpoints():
+def test_from_model_with_existing_checkpoints(checkpoint_root: Path):
     """Test that from_model raises an error when checkpoints exist."""
     # Create a simple model
     model = torch.nn.Linear(10, 10)
 
     # Create initial EMA instance and some checkpoints
-    checkpoint_dir = Path("test-checkpoints")
+    checkpoint_dir = checkpoint_root / "test-checkpoints"
     posthoc_ema = PostHocEMA.from_model(
         model=model,
         checkpoint_dir=checkpoint_dir,
@@ -715,9 +638,3 @@ def test_from_model_with_existing_checkpoints():
             model=model,
             checkpoint_dir=checkpoint_dir,
         )
-
-    # Clean up
-    if checkpoint_dir.exists():
-        for file in checkpoint_dir.glob("*"):
-            file.unlink()
-        checkpoint_dir.rmdir()
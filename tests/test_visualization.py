@@ -145,7 +145,7 @@ def test_reconstruction_error_at_source_values():
     assert all(e < 1e-4 for e in errors_at_source), "Errors at source sigma_rels should be reasonably small" 
 
 
-def test_posthoc_ema_reconstruction_error(tmp_path: Path):
+def test_posthoc_ema_reconstruction_error(checkpoint_root: Path):
     """Test that PostHocEMA.reconstruction_error runs without errors."""
     # Create a simple model
     model = nn.Linear(10, 10)
@@ -153,7 +153,7 @@ def test_posthoc_ema_reconstruction_error(tmp_path: Path):
     # Initialize PostHocEMA
     posthoc_ema = PostHocEMA.from_model(
         model=model,
-        checkpoint_dir=tmp_path,
+        checkpoint_dir=checkpoint_root,
         max_checkpoints=100,
         update_every=5,
         checkpoint_every=5,
@@ -1,12 +1,10 @@
 from pathlib import Path
 import time
-import shutil
 
 import psutil
 import torch
 import torch.cuda
 import torch.nn as nn
-import pytest
 
 from posthoc_ema import PostHocEMA
 
@@ -34,22 +32,6 @@ posthoc_ema = PostHocEMA.from_model(
 """
 
 
-@pytest.fixture(autouse=True)
-def cleanup_checkpoints():
-    """Clean up test checkpoints before and after each test."""
-    # Cleanup before test
-    for path in ["test_ema_checkpoint"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
-
-    yield
-
-    # Cleanup after test
-    for path in ["test_ema_checkpoint"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
-
-
 def get_gpu_memory_usage():
     """Get current GPU memory usage in MB."""
     if not torch.cuda.is_available():
@@ -115,7 +97,7 @@ def get_module_device(model: nn.Module) -> str:
     return next(model.parameters()).device.type
 
 
-def test_vram_usage_with_classifier():
+def test_vram_usage_with_classifier(tmp_path: Path):
     """Test VRAM usage before and after PostHocEMA initialization."""
     if not torch.cuda.is_available():
         return
@@ -151,7 +133,7 @@ def test_vram_usage_with_classifier():
     print("\nStarting PostHocEMA initialization...")
     pre_init_memory = get_gpu_memory_usage()
     reset_gpu_max_memory()  # Reset peak memory tracking before initialization
-    save_path = Path("test_ema_checkpoint")
+    save_path = tmp_path / "test_ema_checkpoint"
 
     # This should cause a VRAM spike due to model copying before CPU transfer
     def init_ema():
@@ -292,10 +274,6 @@ def test_vram_usage_with_classifier():
     model.cpu()  # Move model to CPU before deletion
     del model
     del posthoc_ema
-    if save_path.exists():
-        for file in save_path.glob("*"):
-            file.unlink()
-        save_path.rmdir()
 
     # Force CUDA cleanup
     torch.cuda.empty_cache()
@@ -319,7 +297,7 @@ def test_vram_usage_with_classifier():
     ), f"Failed to cleanup CUDA memory. Still using {final_memory:.2f}MB VRAM"
 
 
-def test_synthesis_memory_usage():
+def test_synthesis_memory_usage(tmp_path: Path):
     """Test memory usage specifically during EMA synthesis."""
     if not torch.cuda.is_available():
         return
@@ -347,7 +325,7 @@ def test_synthesis_memory_usage():
     print(f"RAM:  {model_ram:.2f}MB")
 
     # Initialize EMA and create some checkpoints
-    save_path = Path("test_ema_checkpoint")
+    save_path = tmp_path / "test_ema_checkpoint"
     posthoc_ema = PostHocEMA.from_model(
         model,
         save_path,
@@ -436,10 +414,6 @@ def test_synthesis_memory_usage():
     model.cpu()
     del model
     del posthoc_ema
-    if save_path.exists():
-        for file in save_path.glob("*"):
-            file.unlink()
-        save_path.rmdir()
 
     torch.cuda.empty_cache()
     if torch.cuda.is_available():